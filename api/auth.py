@@ -1,78 +1,153 @@
-from typing import Optional
+import hmac
+from typing import NamedTuple, Optional
 
+import orjson
 from fastapi import Depends, HTTPException, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from loguru import logger
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from open_notebook.utils.encryption import get_secret_from_env
 
+# The API password is read once at import time instead of on every request.
+# Use reset_password_cache() after changing OPEN_NOTEBOOK_PASSWORD at runtime.
+_API_PASSWORD: Optional[str] = get_secret_from_env("OPEN_NOTEBOOK_PASSWORD")
+_API_PASSWORD_BYTES: Optional[bytes] = _API_PASSWORD.encode() if _API_PASSWORD else None
 
-class PasswordAuthMiddleware(BaseHTTPMiddleware):
+
+class _Rejection(NamedTuple):
+    """A complete 401 response, serialized once instead of per rejected request."""
+
+    detail: str
+    body: bytes
+    headers: list[tuple[bytes, bytes]]
+
+
+# CORS headers are left to CORSMiddleware, which wraps this middleware and only
+# echoes the Origin back for allowed origins.
+def _rejection(detail: str) -> _Rejection:
+    body = orjson.dumps({"detail": detail})
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+        (b"www-authenticate", b"Bearer"),
+    ]
+    return _Rejection(detail, body, headers)
+
+
+_REJECT_MISSING = _rejection("Missing authorization header")
+_REJECT_BAD_FMT = _rejection("Invalid authorization header format")
+_REJECT_BAD_PWD = _rejection("Invalid password")
+
+
+def reset_password_cache() -> None:
+    """Re-read OPEN_NOTEBOOK_PASSWORD (or its _FILE variant) into the cache."""
+    global _API_PASSWORD, _API_PASSWORD_BYTES
+    _API_PASSWORD = get_secret_from_env("OPEN_NOTEBOOK_PASSWORD")
+    _API_PASSWORD_BYTES = _API_PASSWORD.encode() if _API_PASSWORD else None
+
+
+class PasswordAuthMiddleware:
     """
     Middleware to check password authentication for all API requests.
     Always active with default password if OPEN_NOTEBOOK_PASSWORD is not set.
     Supports Docker secrets via OPEN_NOTEBOOK_PASSWORD_FILE.
+
+    Implemented as a plain ASGI middleware rather than BaseHTTPMiddleware so
+    the auth decision is made straight from the ASGI scope, without wrapping
+    every request in Starlette Request/Response objects and an extra task.
     """
 
-    def __init__(self, app, excluded_paths: Optional[list] = None):
-        super().__init__(app)
-        self.password = get_secret_from_env("OPEN_NOTEBOOK_PASSWORD")
-        self.excluded_paths = excluded_paths or [
-            "/",
-            "/health",
-            "/docs",
-            "/openapi.json",
-            "/redoc",
-        ]
-
-    async def dispatch(self, request: Request, call_next):
-        # Skip authentication if no password is set
-        if not self.password:
-            return await call_next(request)
+    def __init__(
+        self,
+        app: ASGIApp,
+        excluded_paths: Optional[list] = None,
+        excluded_prefixes: Optional[list] = None,
+    ):
+        self.app = app
+        # Exact matches, plus prefixes for routes nested under the docs UIs
+        # (e.g. FastAPI's /docs/oauth2-redirect)
+        self.excluded_paths = frozenset(
+            excluded_paths or ("/", "/health", "/docs", "/openapi.json", "/redoc")
+        )
+        self.excluded_prefixes = tuple(
+            excluded_prefixes
+            if excluded_prefixes is not None
+            else ("/docs/", "/redoc/")
+        )
 
-        # Skip authentication for excluded paths
-        if request.url.path in self.excluded_paths:
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Only HTTP requests are authenticated (lifespan, websocket pass through)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
         # Skip authentication for CORS preflight requests (OPTIONS)
-        if request.method == "OPTIONS":
-            return await call_next(request)
-
-        # Check authorization header
-        auth_header = request.headers.get("Authorization")
-
-        if not auth_header:
-            return JSONResponse(
-                status_code=401,
-                content={"detail": "Missing authorization header"},
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-
-        # Expected format: "Bearer {password}"
-        try:
-            scheme, credentials = auth_header.split(" ", 1)
-            if scheme.lower() != "bearer":
-                raise ValueError("Invalid authentication scheme")
-        except ValueError:
-            return JSONResponse(
-                status_code=401,
-                content={"detail": "Invalid authorization header format"},
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-
-        # Check password
-        if credentials != self.password:
-            return JSONResponse(
-                status_code=401,
-                content={"detail": "Invalid password"},
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        if scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        # Read the module-level cache so reset_password_cache() takes effect
+        password = _API_PASSWORD_BYTES
+
+        # Skip authentication if no password is set
+        if not password:
+            await self.app(scope, receive, send)
+            return
+
+        # Skip authentication for excluded paths
+        path = scope["path"]
+        if path in self.excluded_paths or path.startswith(self.excluded_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        # Check authorization header. Every check above is an O(1) scope
+        # lookup, so unauthenticated paths never touch the header list.
+        rejection = _check_authorization(_find_authorization(scope), password)
+        if rejection is not None:
+            await _send_401(send, rejection)
+            return
 
         # Password is correct, proceed with the request
-        response = await call_next(request)
-        return response
+        await self.app(scope, receive, send)
+
+
+def _find_authorization(scope: Scope) -> Optional[bytes]:
+    # ASGI header names are lowercased bytes, so no decoding is needed
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            return value
+    return None
+
+
+def _check_authorization(
+    auth_header: Optional[bytes], password: bytes
+) -> Optional[_Rejection]:
+    """Return the prebuilt 401 for a rejected Authorization header, or None if valid."""
+    if not auth_header:
+        return _REJECT_MISSING
+
+    # Expected format: "Bearer {password}"
+    scheme, sep, credentials = auth_header.partition(b" ")
+    if not sep or scheme.lower() != b"bearer":
+        return _REJECT_BAD_FMT
+
+    # Check password (constant-time to avoid leaking it through timing)
+    if not hmac.compare_digest(credentials, password):
+        return _REJECT_BAD_PWD
+
+    return None
+
+
+async def _send_401(send: Send, rejection: _Rejection) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 401,
+            "headers": rejection.headers,
+        }
+    )
+    await send({"type": "http.response.body", "body": rejection.body})
 
 
 # Optional: HTTPBearer security scheme for OpenAPI documentation
@@ -89,7 +164,7 @@ def check_api_password(
     Returns True without checking credentials if OPEN_NOTEBOOK_PASSWORD is not configured.
     Raises 401 if credentials are missing or don't match the configured password.
     """
-    password = get_secret_from_env("OPEN_NOTEBOOK_PASSWORD")
+    password = _API_PASSWORD_BYTES
 
     # No password configured - skip authentication
     if not password:
@@ -104,7 +179,7 @@ def check_api_password(
         )
 
     # Check password
-    if credentials.credentials != password:
+    if not hmac.compare_digest(credentials.credentials.encode(), password):
         raise HTTPException(
             status_code=401,
             detail="Invalid password",
@@ -112,3 +187,25 @@ def check_api_password(
         )
 
     return True
+
+
+async def require_password(request: Request) -> None:
+    """
+    Lightweight dependency for routes that only need "is this request authenticated?".
+    Returns immediately when OPEN_NOTEBOOK_PASSWORD is not configured; otherwise
+    checks the raw Authorization header the same way PasswordAuthMiddleware does,
+    without going through HTTPBearer. Add dependencies=[Depends(security)] to the
+    route if the bearer scheme should still appear in the OpenAPI docs.
+    Raises 401 if the header is missing, malformed or has the wrong password.
+    """
+    password = _API_PASSWORD_BYTES
+    if password is None:
+        return
+
+    rejection = _check_authorization(_find_authorization(request.scope), password)
+    if rejection is not None:
+        raise HTTPException(
+            status_code=401,
+            detail=rejection.detail,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
@@ -5,7 +5,7 @@ Provides endpoints to check authentication status.
 
 from fastapi import APIRouter
 
-from open_notebook.utils.encryption import get_secret_from_env
+import api.auth
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -17,7 +17,8 @@ async def get_auth_status():
     Returns whether a password is required to access the API.
     Supports Docker secrets via OPEN_NOTEBOOK_PASSWORD_FILE.
     """
-    auth_enabled = bool(get_secret_from_env("OPEN_NOTEBOOK_PASSWORD"))
+    # Same cached password the auth middleware enforces
+    auth_enabled = bool(api.auth._API_PASSWORD)
 
     return {
         "auth_enabled": auth_enabled,
@@ -1,4 +1,8 @@
+from typing import List, Optional
+
+import orjson
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response
 from loguru import logger
 
 from api.models import SettingsResponse, SettingsUpdate
@@ -7,82 +11,114 @@ from open_notebook.exceptions import InvalidInputError
 
 router = APIRouter()
 
+# ContentSettings.get_instance() already returns a process-wide singleton that
+# reads the database only once, so only the serialized GET body is cached here.
+# It is refreshed by update_settings; other in-process writes to the singleton
+# are not reflected until reset_settings_cache() is called.
+_settings_response_bytes: Optional[bytes] = None
+
+
+def reset_settings_cache() -> None:
+    """
+    Drop the cached GET body and the ContentSettings singleton.
+    update_settings calls this when a save fails, so unsaved in-place edits are
+    discarded and the next read reloads the stored settings from the database.
+    """
+    global _settings_response_bytes
+    _settings_response_bytes = None
+    ContentSettings.clear_instance()
+
+
+def _str_or_none(value) -> Optional[str]:
+    return value if isinstance(value, str) else None
+
+
+def _str_list_or_none(value) -> Optional[List[str]]:
+    if not isinstance(value, list):
+        return None
+    # Common case: already a clean list of strings, reuse it without copying
+    if all(type(item) is str for item in value):
+        return value
+    return [item for item in value if isinstance(item, str)]
+
+
+def _encode_settings(settings: ContentSettings) -> bytes:
+    # Serialized directly with orjson; SettingsResponse only documents the shape
+    return orjson.dumps(
+        {
+            "default_content_processing_engine_doc": _str_or_none(
+                settings.default_content_processing_engine_doc
+            ),
+            "default_content_processing_engine_url": _str_or_none(
+                settings.default_content_processing_engine_url
+            ),
+            "default_embedding_option": _str_or_none(settings.default_embedding_option),
+            "auto_delete_files": _str_or_none(settings.auto_delete_files),
+            "youtube_preferred_languages": _str_list_or_none(
+                settings.youtube_preferred_languages
+            ),
+        }
+    )
+
 
-@router.get("/settings", response_model=SettingsResponse)
+_SETTINGS_RESPONSES: dict = {200: {"model": SettingsResponse}}
+
+
+@router.get("/settings", responses=_SETTINGS_RESPONSES)
 async def get_settings():
     """Get all application settings."""
+    global _settings_response_bytes
     try:
-        settings: ContentSettings = await ContentSettings.get_instance()  # type: ignore[assignment]
+        # The payload only changes through update_settings, so the serialized
+        # body is reused until then
+        if _settings_response_bytes is None:
+            settings: ContentSettings = await ContentSettings.get_instance()  # type: ignore[assignment]
+            _settings_response_bytes = _encode_settings(settings)
 
-        return SettingsResponse(
-            default_content_processing_engine_doc=settings.default_content_processing_engine_doc,
-            default_content_processing_engine_url=settings.default_content_processing_engine_url,
-            default_embedding_option=settings.default_embedding_option,
-            auto_delete_files=settings.auto_delete_files,
-            youtube_preferred_languages=settings.youtube_preferred_languages,
-        )
+        return Response(content=_settings_response_bytes, media_type="application/json")
     except Exception as e:
         logger.error(f"Error fetching settings: {str(e)}")
-        raise HTTPException(
-            status_code=500, detail="Error fetching settings"
-        )
+        raise HTTPException(status_code=500, detail="Error fetching settings")
 
 
-@router.put("/settings", response_model=SettingsResponse)
+@router.put("/settings", responses=_SETTINGS_RESPONSES)
 async def update_settings(settings_update: SettingsUpdate):
     """Update application settings."""
+    global _settings_response_bytes
     try:
         settings: ContentSettings = await ContentSettings.get_instance()  # type: ignore[assignment]
 
-        # Update only provided fields
+        # Update only provided fields; values are validated on assignment
+        # against the ContentSettings Literal types
         if settings_update.default_content_processing_engine_doc is not None:
-            # Cast to proper literal type
-            from typing import Literal, cast
-
-            settings.default_content_processing_engine_doc = cast(
-                Literal["auto", "docling", "simple"],
-                settings_update.default_content_processing_engine_doc,
+            settings.default_content_processing_engine_doc = (
+                settings_update.default_content_processing_engine_doc  # type: ignore[assignment]
             )
         if settings_update.default_content_processing_engine_url is not None:
-            from typing import Literal, cast
-
-            settings.default_content_processing_engine_url = cast(
-                Literal["auto", "firecrawl", "jina", "simple"],
-                settings_update.default_content_processing_engine_url,
+            settings.default_content_processing_engine_url = (
+                settings_update.default_content_processing_engine_url  # type: ignore[assignment]
             )
         if settings_update.default_embedding_option is not None:
-            from typing import Literal, cast
-
-            settings.default_embedding_option = cast(
-                Literal["ask", "always", "never"],
-                settings_update.default_embedding_option,
-            )
+            settings.default_embedding_option = settings_update.default_embedding_option  # type: ignore[assignment]
         if settings_update.auto_delete_files is not None:
-            from typing import Literal, cast
-
-            settings.auto_delete_files = cast(
-                Literal["yes", "no"], settings_update.auto_delete_files
-            )
+            settings.auto_delete_files = settings_update.auto_delete_files  # type: ignore[assignment]
         if settings_update.youtube_preferred_languages is not None:
             settings.youtube_preferred_languages = (
                 settings_update.youtube_preferred_languages
             )
 
         await settings.update()
+        _settings_response_bytes = _encode_settings(settings)
 
-        return SettingsResponse(
-            default_content_processing_engine_doc=settings.default_content_processing_engine_doc,
-            default_content_processing_engine_url=settings.default_content_processing_engine_url,
-            default_embedding_option=settings.default_embedding_option,
-            auto_delete_files=settings.auto_delete_files,
-            youtube_preferred_languages=settings.youtube_preferred_languages,
-        )
+        return Response(content=_settings_response_bytes, media_type="application/json")
     except HTTPException:
         raise
     except InvalidInputError as e:
+        # The singleton was edited in place and may hold unsaved changes;
+        # drop it so the next read reloads the saved values
+        reset_settings_cache()
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
+        reset_settings_cache()
         logger.error(f"Error updating settings: {str(e)}")
-        raise HTTPException(
-            status_code=500, detail="Error updating settings"
-        )
+        raise HTTPException(status_code=500, detail="Error updating settings")
@@ -28,4 +28,7 @@ if __name__ == "__main__":
         port=port,
         reload=reload,
         reload_dirs=[str(current_dir)] if reload else None,
+        # uvloop is a dependency everywhere except Windows, so require it there
+        # rather than silently falling back to asyncio if it fails to import
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
     )
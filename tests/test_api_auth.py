@@ -0,0 +1,279 @@
+"""
+Tests for the password authentication middleware.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from fastapi.testclient import TestClient
+
+from api.auth import (
+    PasswordAuthMiddleware,
+    _check_authorization,
+    check_api_password,
+    require_password,
+    reset_password_cache,
+)
+
+
+@pytest.fixture
+def api_password():
+    """Configure the cached API password for the duration of a test."""
+    with patch.dict("os.environ", {"OPEN_NOTEBOOK_PASSWORD": "secret"}):
+        reset_password_cache()
+        yield "secret"
+    reset_password_cache()
+
+
+@pytest.fixture
+def auth_client(api_password):
+    """Create a test client for a minimal app protected by the auth middleware."""
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    @app.get("/api/protected")
+    async def protected():
+        return {"ok": True}
+
+    @app.options("/api/protected")
+    async def protected_options():
+        return {"preflight": True}
+
+    @app.get("/docsearch")
+    async def docsearch():
+        return {"ok": True}
+
+    app.add_middleware(PasswordAuthMiddleware)
+    return TestClient(app)
+
+
+class TestPasswordAuthMiddleware:
+    """Test suite for PasswordAuthMiddleware."""
+
+    def test_valid_password(self, auth_client):
+        """Test request with the correct bearer token is allowed."""
+        response = auth_client.get(
+            "/api/protected", headers={"Authorization": "Bearer secret"}
+        )
+        assert response.status_code == 200
+        assert response.json() == {"ok": True}
+
+    def test_scheme_is_case_insensitive(self, auth_client):
+        """Test the bearer scheme is matched case-insensitively."""
+        response = auth_client.get(
+            "/api/protected", headers={"Authorization": "bearer secret"}
+        )
+        assert response.status_code == 200
+
+    def test_missing_header(self, auth_client):
+        """Test request without Authorization header is rejected."""
+        response = auth_client.get("/api/protected")
+        assert response.status_code == 401
+        assert response.json() == {"detail": "Missing authorization header"}
+        assert response.headers["www-authenticate"] == "Bearer"
+
+    @pytest.mark.parametrize("header", ["secret", "Basic secret", "Bearer"])
+    def test_invalid_format(self, auth_client, header):
+        """Test malformed Authorization headers are rejected."""
+        response = auth_client.get("/api/protected", headers={"Authorization": header})
+        assert response.status_code == 401
+        assert response.json() == {"detail": "Invalid authorization header format"}
+
+    def test_invalid_password(self, auth_client):
+        """Test request with a wrong password is rejected."""
+        response = auth_client.get(
+            "/api/protected", headers={"Authorization": "Bearer wrong"}
+        )
+        assert response.status_code == 401
+        assert response.json() == {"detail": "Invalid password"}
+
+    @pytest.mark.parametrize(
+        "credentials,status_code",
+        [("pässwörd", 200), ("passwörd", 401), ("pässwörð", 401)],
+    )
+    def test_non_ascii_password(self, credentials, status_code):
+        """Test credentials are compared as raw header bytes without decoding."""
+        app = FastAPI()
+
+        @app.get("/api/protected")
+        async def protected():
+            return {"ok": True}
+
+        app.add_middleware(PasswordAuthMiddleware)
+        client = TestClient(app)
+
+        with patch.dict("os.environ", {"OPEN_NOTEBOOK_PASSWORD": "pässwörd"}):
+            reset_password_cache()
+            response = client.get(
+                "/api/protected",
+                headers={"Authorization": f"Bearer {credentials}".encode()},
+            )
+        reset_password_cache()
+
+        assert response.status_code == status_code
+
+    def test_excluded_path(self, auth_client):
+        """Test excluded paths do not require authentication."""
+        response = auth_client.get("/health")
+        assert response.status_code == 200
+
+    def test_excluded_prefix(self, auth_client):
+        """Test routes nested under the docs UI do not require authentication."""
+        response = auth_client.get("/docs/oauth2-redirect")
+        assert response.status_code == 200
+
+    def test_excluded_prefix_requires_separator(self, auth_client):
+        """Test paths merely starting with an excluded name still require auth."""
+        response = auth_client.get("/docsearch")
+        assert response.status_code == 401
+
+    def test_options_bypasses_auth(self, auth_client):
+        """Test CORS preflight requests are not authenticated."""
+        response = auth_client.options("/api/protected")
+        assert response.status_code == 200
+        assert response.json() == {"preflight": True}
+
+
+class TestCheckApiPassword:
+    """Test suite for the check_api_password dependency."""
+
+    def test_no_password_configured(self):
+        """Test authentication is skipped when no password is configured."""
+        assert check_api_password(None) is True
+
+    def test_valid_credentials(self, api_password):
+        """Test matching credentials are accepted."""
+        credentials = HTTPAuthorizationCredentials(
+            scheme="Bearer", credentials=api_password
+        )
+        assert check_api_password(credentials) is True
+
+    def test_missing_credentials(self, api_password):
+        """Test missing credentials raise 401."""
+        with pytest.raises(HTTPException) as exc_info:
+            check_api_password(None)
+        assert exc_info.value.status_code == 401
+
+    def test_invalid_credentials(self, api_password):
+        """Test wrong credentials raise 401."""
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="wrong")
+        with pytest.raises(HTTPException) as exc_info:
+            check_api_password(credentials)
+        assert exc_info.value.detail == "Invalid password"
+
+
+@pytest.fixture
+def dependency_client():
+    """Create a test client for a route guarded only by require_password."""
+    app = FastAPI()
+
+    @app.get("/api/guarded", dependencies=[Depends(require_password)])
+    async def guarded():
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+class TestRequirePassword:
+    """Test suite for the require_password dependency."""
+
+    def test_no_password_configured(self, dependency_client):
+        """Test the dependency is a no-op when no password is configured."""
+        response = dependency_client.get("/api/guarded")
+        assert response.status_code == 200
+
+    def test_valid_password(self, api_password, dependency_client):
+        """Test matching bearer token is accepted."""
+        response = dependency_client.get(
+            "/api/guarded", headers={"Authorization": f"Bearer {api_password}"}
+        )
+        assert response.status_code == 200
+
+    @pytest.mark.parametrize(
+        "headers,detail",
+        [
+            ({}, "Missing authorization header"),
+            ({"Authorization": "Basic secret"}, "Invalid authorization header format"),
+            ({"Authorization": "Bearer wrong"}, "Invalid password"),
+        ],
+    )
+    def test_rejected(self, api_password, dependency_client, headers, detail):
+        """Test missing, malformed or wrong credentials raise 401."""
+        response = dependency_client.get("/api/guarded", headers=headers)
+        assert response.status_code == 401
+        assert response.json() == {"detail": detail}
+        assert response.headers["www-authenticate"] == "Bearer"
+
+
+class TestAuthCheck:
+    """Test suite for the Starlette-free auth check used by the middleware."""
+
+    def test_valid(self):
+        """Test a matching bearer token passes."""
+        assert _check_authorization(b"Bearer secret", b"secret") is None
+
+    @pytest.mark.parametrize(
+        "auth,body",
+        [
+            (None, b'{"detail":"Missing authorization header"}'),
+            (b"", b'{"detail":"Missing authorization header"}'),
+            (b"secret", b'{"detail":"Invalid authorization header format"}'),
+            (b"Token secret", b'{"detail":"Invalid authorization header format"}'),
+            (b"Bearer wrong", b'{"detail":"Invalid password"}'),
+        ],
+    )
+    def test_rejected(self, auth, body):
+        """Test rejected headers map to the matching prebuilt 401 response."""
+        rejection = _check_authorization(auth, b"secret")
+        assert rejection is not None
+        assert rejection.body == body
+        assert (b"content-length", str(len(body)).encode()) in rejection.headers
+        assert (b"www-authenticate", b"Bearer") in rejection.headers
+
+
+class TestPasswordCacheReset:
+    """Test reset_password_cache() reaches every auth check."""
+
+    def test_reset_applies_to_middleware_and_dependency(self):
+        """Test the middleware and require_password agree after a password change."""
+        app = FastAPI()
+
+        @app.get("/api/guarded", dependencies=[Depends(require_password)])
+        async def guarded():
+            return {"ok": True}
+
+        app.add_middleware(PasswordAuthMiddleware)
+        client = TestClient(app)
+
+        with patch.dict("os.environ", {"OPEN_NOTEBOOK_PASSWORD": "old"}):
+            reset_password_cache()
+            response = client.get(
+                "/api/guarded", headers={"Authorization": "Bearer old"}
+            )
+            assert response.status_code == 200
+
+            with patch.dict("os.environ", {"OPEN_NOTEBOOK_PASSWORD": "new"}):
+                reset_password_cache()
+                response = client.get(
+                    "/api/guarded", headers={"Authorization": "Bearer new"}
+                )
+                assert response.status_code == 200
+                response = client.get(
+                    "/api/guarded", headers={"Authorization": "Bearer old"}
+                )
+                assert response.status_code == 401
+        reset_password_cache()
+
+    def test_auth_status_uses_cached_password(self, api_password, client):
+        """Test /api/auth/status reports the cached password state."""
+        # Changing the env without reset_password_cache() must not change the
+        # reported state, just as it does not change what the middleware enforces
+        with patch.dict("os.environ", {"OPEN_NOTEBOOK_PASSWORD": ""}):
+            response = client.get("/api/auth/status")
+        assert response.status_code == 200
+        assert response.json()["auth_enabled"] is True
@@ -275,3 +275,26 @@ class TestNotesRouter:
         response = client.delete("/api/notes/note:123")
         assert response.status_code == 200
         mock_note.delete.assert_called_once()
+
+
+class TestErrorResponseCorsHeaders:
+    """Test CORS headers added by the API exception handlers."""
+
+    def test_error_without_origin_has_no_cors_headers(self, client):
+        """Test error responses skip CORS headers for non-browser clients."""
+        response = client.get("/api/this-route-does-not-exist")
+        assert response.status_code == 404
+        assert "access-control-allow-origin" not in response.headers
+        assert "access-control-allow-credentials" not in response.headers
+
+    def test_error_with_origin_echoes_origin(self, client):
+        """Test error responses keep CORS headers for browser clients."""
+        response = client.get(
+            "/api/this-route-does-not-exist",
+            headers={"Origin": "http://localhost:3000"},
+        )
+        assert response.status_code == 404
+        assert (
+            response.headers["access-control-allow-origin"] == "http://localhost:3000"
+        )
+        assert response.headers["access-control-allow-credentials"] == "true"
@@ -2,25 +2,50 @@
 Tests for /api/notebooks/{id}/context router endpoint.
 """
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 
+@pytest.fixture
+def make_source():
+    """Factory for lightweight Source stand-ins with an async get_context."""
+
+    def _make_source(id="source:1", context=None):
+        return SimpleNamespace(
+            id=id, get_context=AsyncMock(return_value=context or {"id": id})
+        )
+
+    return _make_source
+
+
+@pytest.fixture
+def make_note():
+    """Factory for lightweight Note stand-ins with a sync get_context."""
+
+    def _make_note(id="note:1", context=None):
+        return SimpleNamespace(
+            id=id, get_context=MagicMock(return_value=context or {"id": id})
+        )
+
+    return _make_note
+
+
 class TestContextRouter:
     """Test suite for /api/notebooks/{id}/context endpoint."""
 
     @pytest.mark.asyncio
     @patch("api.routers.context.Notebook")
-    async def test_get_notebook_context_default(self, mock_notebook_class, client):
+    async def test_get_notebook_context_default(
+        self, mock_notebook_class, client, make_source, make_note
+    ):
         """Test GET /api/notebooks/{id}/context with default config."""
         mock_notebook = MagicMock()
         mock_notebook.id = "notebook:123"
 
-        mock_source = MagicMock()
-        mock_source.get_context = AsyncMock(return_value="Source context")
-        mock_note = MagicMock()
-        mock_note.get_context = AsyncMock(return_value="Note context")
+        mock_source = make_source(context={"id": "source:1", "title": "Source"})
+        mock_note = make_note(context={"id": "note:1", "title": "Note"})
 
         mock_notebook.get_sources = AsyncMock(return_value=[mock_source])
         mock_notebook.get_notes = AsyncMock(return_value=[mock_note])
@@ -33,26 +58,31 @@ class TestContextRouter:
         )
         assert response.status_code == 200
         data = response.json()
-        assert "sources" in data
-        assert "notes" in data
+        assert data["sources"] == [{"id": "source:1", "title": "Source"}]
+        assert data["notes"] == [{"id": "note:1", "title": "Note"}]
+        mock_source.get_context.assert_awaited_once_with(context_size="short")
 
     @pytest.mark.asyncio
     @patch("api.routers.context.Source")
     @patch("api.routers.context.Note")
     @patch("api.routers.context.Notebook")
     async def test_get_notebook_context_with_config(
-        self, mock_notebook_class, mock_note_class, mock_source_class, client
+        self,
+        mock_notebook_class,
+        mock_note_class,
+        mock_source_class,
+        client,
+        make_source,
+        make_note,
     ):
         """Test GET /api/notebooks/{id}/context with custom config."""
         mock_notebook = MagicMock()
         mock_notebook.id = "notebook:123"
 
-        mock_source = MagicMock()
-        mock_source.get_context = AsyncMock(return_value="Full source context")
+        mock_source = make_source()
         mock_source_class.get = AsyncMock(return_value=mock_source)
 
-        mock_note = MagicMock()
-        mock_note.get_context = AsyncMock(return_value="Full note context")
+        mock_note = make_note()
         mock_note_class.get = AsyncMock(return_value=mock_note)
 
         mock_notebook_class.get = AsyncMock(return_value=mock_notebook)
@@ -6,6 +6,16 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from api.routers.settings import reset_settings_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_settings_cache():
+    """Ensure each test loads settings through the patched ContentSettings."""
+    reset_settings_cache()
+    yield
+    reset_settings_cache()
+
 
 class TestSettingsRouter:
     """Test suite for /api/settings endpoints."""
@@ -86,3 +96,60 @@ class TestSettingsRouter:
             json={"default_embedding_option": "invalid"},
         )
         assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    @patch("api.routers.settings.ContentSettings")
+    async def test_get_settings_is_cached(self, mock_content_settings, client):
+        """Test repeated GET /api/settings loads settings only once."""
+        mock_settings = MagicMock()
+        mock_settings.default_content_processing_engine_doc = "auto"
+        mock_settings.default_content_processing_engine_url = "auto"
+        mock_settings.default_embedding_option = "ask"
+        mock_settings.auto_delete_files = "yes"
+        mock_settings.youtube_preferred_languages = ["en"]
+
+        mock_content_settings.get_instance = AsyncMock(return_value=mock_settings)
+
+        assert client.get("/api/settings").status_code == 200
+        assert client.get("/api/settings").status_code == 200
+        mock_content_settings.get_instance.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("api.routers.settings.ContentSettings")
+    async def test_update_settings_refreshes_cache(self, mock_content_settings, client):
+        """Test GET /api/settings reflects a previous PUT without reloading."""
+        mock_settings = MagicMock()
+        mock_settings.default_content_processing_engine_doc = "auto"
+        mock_settings.default_content_processing_engine_url = "auto"
+        mock_settings.default_embedding_option = "ask"
+        mock_settings.auto_delete_files = "yes"
+        mock_settings.youtube_preferred_languages = ["en"]
+        mock_settings.update = AsyncMock()
+
+        mock_content_settings.get_instance = AsyncMock(return_value=mock_settings)
+
+        response = client.put("/api/settings", json={"auto_delete_files": "no"})
+        assert response.status_code == 200
+
+        response = client.get("/api/settings")
+        assert response.status_code == 200
+        assert response.json()["auto_delete_files"] == "no"
+        mock_content_settings.get_instance.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("open_notebook.domain.base.repo_query")
+    async def test_failed_update_is_not_served(self, mock_repo_query, client):
+        """Test GET /api/settings returns saved values after a failed PUT."""
+        mock_repo_query.return_value = [{"auto_delete_files": "yes"}]
+
+        with patch(
+            "api.routers.settings.ContentSettings.update",
+            new=AsyncMock(side_effect=Exception("DB down")),
+        ):
+            response = client.put("/api/settings", json={"auto_delete_files": "no"})
+        assert response.status_code == 500
+
+        response = client.get("/api/settings")
+        assert response.status_code == 200
+        assert response.json()["auto_delete_files"] == "yes"
+        assert mock_repo_query.await_count == 2
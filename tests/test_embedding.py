@@ -4,13 +4,21 @@ Unit tests for the open_notebook.utils.embedding module.
 Tests embedding generation and mean pooling functionality.
 """
 
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+import numpy as np
 import pytest
 
+from open_notebook.exceptions import ExternalServiceError
+from open_notebook.utils.chunking import ContentType
 from open_notebook.utils.embedding import (
+    EMBEDDING_BATCH_SIZE,
+    EMBEDDING_MAX_RETRIES,
     generate_embedding,
     generate_embeddings,
     mean_pool_embeddings,
 )
+from open_notebook.utils.error_classifier import classify_error
 
 # ============================================================================
 # TEST SUITE 1: Mean Pooling
@@ -54,7 +62,6 @@ class TestMeanPoolEmbeddings:
         assert len(result) == 4
         # Result should be same direction, just normalized
         # Original is already normalized if we normalize it
-        import numpy as np
         orig_norm = np.linalg.norm(embedding)
         expected = [v / orig_norm for v in embedding]
         for i in range(4):
@@ -75,14 +82,12 @@ class TestMeanPoolEmbeddings:
         ]
         result = await mean_pool_embeddings(embeddings)
         # Check result is unit length
-        import numpy as np
         norm = np.linalg.norm(result)
         assert abs(norm - 1.0) < 0.001
 
     @pytest.mark.asyncio
     async def test_high_dimensional(self):
         """Test mean pooling with high-dimensional embeddings."""
-        import numpy as np
         # Create random embeddings of dimension 768 (typical embedding size)
         np.random.seed(42)
         embeddings = [
@@ -114,8 +119,6 @@ class TestGenerateEmbeddings:
     @pytest.mark.asyncio
     async def test_no_model_raises(self):
         """Test that missing model raises ValueError."""
-        from unittest.mock import AsyncMock, patch
-
         with patch(
             "open_notebook.ai.models.model_manager.get_embedding_model",
             new_callable=AsyncMock,
@@ -127,8 +130,6 @@ class TestGenerateEmbeddings:
     @pytest.mark.asyncio
     async def test_successful_embedding(self):
         """Test successful embedding generation with mocked model."""
-        from unittest.mock import AsyncMock, MagicMock, patch
-
         mock_model = MagicMock()
         mock_model.aembed = AsyncMock(return_value=[[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]])
 
@@ -164,8 +165,6 @@ class TestGenerateEmbedding:
     @pytest.mark.asyncio
     async def test_short_text_direct_embedding(self):
         """Test that short text is embedded directly without chunking."""
-        from unittest.mock import AsyncMock, MagicMock, patch
-
         mock_model = MagicMock()
         mock_model.aembed = AsyncMock(return_value=[[0.1, 0.2, 0.3]])
 
@@ -182,8 +181,6 @@ class TestGenerateEmbedding:
     @pytest.mark.asyncio
     async def test_long_text_chunked_and_pooled(self):
         """Test that long text is chunked and mean pooled."""
-        from unittest.mock import AsyncMock, MagicMock, patch
-
         # Create text longer than chunk size
         long_text = "This is a sentence. " * 200  # ~4000 chars
 
@@ -210,10 +207,6 @@ class TestGenerateEmbedding:
     @pytest.mark.asyncio
     async def test_content_type_parameter(self):
         """Test that content type parameter is passed through."""
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        from open_notebook.utils.chunking import ContentType
-
         mock_model = MagicMock()
         mock_model.aembed = AsyncMock(return_value=[[0.1, 0.2, 0.3]])
 
@@ -232,10 +225,6 @@ class TestGenerateEmbedding:
     @pytest.mark.asyncio
     async def test_batching(self):
         """Test that large input is split into batches of EMBEDDING_BATCH_SIZE."""
-        from unittest.mock import AsyncMock, MagicMock, call, patch
-
-        from open_notebook.utils.embedding import EMBEDDING_BATCH_SIZE
-
         num_texts = 120
         texts = [f"text_{i}" for i in range(num_texts)]
 
@@ -264,8 +253,6 @@ class TestGenerateEmbedding:
     @pytest.mark.asyncio
     async def test_batch_retry_on_transient_failure(self):
         """Test that a transient failure is retried and succeeds."""
-        from unittest.mock import AsyncMock, MagicMock, patch
-
         texts = ["text_a", "text_b"]
         mock_model = MagicMock()
         mock_model.model_name = "test-model"
@@ -293,10 +280,6 @@ class TestGenerateEmbedding:
     @pytest.mark.asyncio
     async def test_batch_retry_exhaustion(self):
         """Test that RuntimeError is raised after all retries are exhausted."""
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        from open_notebook.utils.embedding import EMBEDDING_MAX_RETRIES
-
         texts = ["text_a"]
         mock_model = MagicMock()
         mock_model.model_name = "test-model"
@@ -324,18 +307,12 @@ class TestErrorClassifier413:
     """Test that 413 payload-too-large errors are classified correctly."""
 
     def test_413_status_code(self):
-        from open_notebook.exceptions import ExternalServiceError
-        from open_notebook.utils.error_classifier import classify_error
-
         exc = Exception("HTTP 413: Payload Too Large")
         exc_class, message = classify_error(exc)
         assert exc_class is ExternalServiceError
         assert "payload is too large" in message
 
     def test_request_entity_too_large(self):
-        from open_notebook.exceptions import ExternalServiceError
-        from open_notebook.utils.error_classifier import classify_error
-
         exc = Exception("Request Entity Too Large")
         exc_class, message = classify_error(exc)
         assert exc_class is ExternalServiceError